@@ -4,6 +4,7 @@ from dataclasses import dataclass
 import logging
 from pathlib import Path
 import os
+import sys
 import copy
 import json
 import requests
@@ -11,7 +12,7 @@ from dateutil import parser
 
 from abc import ABC, abstractmethod
 from bs4 import Tag, BeautifulSoup, NavigableString
-from typing import Union, Optional, List, Dict, ClassVar, TypeVar, Type, Tuple, Pattern, Set
+from typing import Union, Optional, List, Dict, ClassVar, TypeVar, Type, Tuple, Pattern, Set, FrozenSet
 
 from tabula import read_pdf
 
@@ -746,28 +747,53 @@ class FIPSCertificate(Certificate, ComplexSerializableType):
 class CommonCriteriaCert(Certificate, ComplexSerializableType):
     cc_url = 'http://commoncriteriaportal.org'
     empty_st_url = 'http://commoncriteriaportal.org/files/epfiles/'
+    maintainance_entry_pattern: ClassVar[Pattern] = re.compile(r'(\d{4}-\d{2}-\d{2}).*?– (.*?)(?:– |$)', re.DOTALL)
 
-    @dataclass(eq=True, frozen=True)
     class MaintainanceReport(ComplexSerializableType):
         """
-        Object for holding maintainance reports.
+        Object for holding maintainance reports. Instances must not be modified after construction, they cache their
+        hash and are kept in sets.
         """
-        maintainance_date: date
-        maintainance_title: str
-        maintainance_report_link: str
-        maintainance_st_link: str
-
-        def __post_init__(self):
-            super().__setattr__('maintainance_report_link',
-                                helpers.sanitize_link(self.maintainance_report_link))
-            super().__setattr__('maintainance_st_link',
-                                helpers.sanitize_link(self.maintainance_st_link))
-            super().__setattr__('maintainance_title',
-                                helpers.sanitize_string(self.maintainance_title))
-            super().__setattr__('maintainance_date', helpers.sanitize_date(self.maintainance_date))
+        __slots__ = ('maintainance_date', 'maintainance_title', 'maintainance_report_link', 'maintainance_st_link',
+                     '_hash')
+
+        def __init__(self, maintainance_date: date, maintainance_title: str, maintainance_report_link: str,
+                     maintainance_st_link: str):
+            self.maintainance_date = helpers.sanitize_date(maintainance_date)
+            self.maintainance_title = helpers.sanitize_string(maintainance_title)
+            self.maintainance_report_link = helpers.sanitize_link(maintainance_report_link)
+            self.maintainance_st_link = helpers.sanitize_link(maintainance_st_link)
+            self._hash = hash(self._key())
+
+        def _key(self) -> Tuple:
+            return (self.maintainance_date, self.maintainance_title, self.maintainance_report_link,
+                    self.maintainance_st_link)
+
+        def __eq__(self, other: object) -> bool:
+            if type(other) is not type(self):
+                return NotImplemented
+            return self._hash == other._hash and self._key() == other._key()
+
+        def __hash__(self) -> int:
+            return self._hash
+
+        def __repr__(self) -> str:
+            return f'{type(self).__qualname__}{self._key()}'
+
+        def __getstate__(self) -> Tuple:
+            return self._key()
+
+        def __setstate__(self, state: Tuple):
+            # Fields were sanitized already, sanitizing them again on copy/unpickle could alter them.
+            # The hash is not stored, string hashes differ between interpreter processes.
+            (self.maintainance_date, self.maintainance_title, self.maintainance_report_link,
+             self.maintainance_st_link) = state
+            self._hash = hash(state)
 
         def to_dict(self):
-            return copy.deepcopy(self.__dict__)
+            return {'maintainance_date': self.maintainance_date, 'maintainance_title': self.maintainance_title,
+                    'maintainance_report_link': self.maintainance_report_link,
+                    'maintainance_st_link': self.maintainance_st_link}
 
         @classmethod
         def from_dict(cls, dct):
@@ -776,24 +802,44 @@ class CommonCriteriaCert(Certificate, ComplexSerializableType):
         def __lt__(self, other):
             return self.maintainance_date < other.maintainance_date
 
-    @dataclass(eq=True, frozen=True)
     class ProtectionProfile(ComplexSerializableType):
         """
-        Object for holding protection profiles.
+        Object for holding protection profiles. Immutable by convention, see MaintainanceReport.
         """
-        pp_name: str
-        pp_link: Optional[str]
+        __slots__ = ('pp_name', 'pp_link', '_hash')
 
-        def __post_init__(self):
-            super().__setattr__('pp_name', helpers.sanitize_string(self.pp_name))
-            super().__setattr__('pp_link', helpers.sanitize_link(self.pp_link))
+        def __init__(self, pp_name: str, pp_link: Optional[str]):
+            self.pp_name = helpers.sanitize_string(pp_name)
+            self.pp_link = helpers.sanitize_link(pp_link)
+            self._hash = hash(self._key())
+
+        def _key(self) -> Tuple:
+            return self.pp_name, self.pp_link
+
+        def __eq__(self, other: object) -> bool:
+            if type(other) is not type(self):
+                return NotImplemented
+            return self._hash == other._hash and self._key() == other._key()
+
+        def __hash__(self) -> int:
+            return self._hash
+
+        def __repr__(self) -> str:
+            return f'{type(self).__qualname__}{self._key()}'
+
+        def __getstate__(self) -> Tuple:
+            return self._key()
+
+        def __setstate__(self, state: Tuple):
+            self.pp_name, self.pp_link = state
+            self._hash = hash(state)
 
         def to_dict(self):
-            return copy.deepcopy(self.__dict__)
+            return {'pp_name': self.pp_name, 'pp_link': self.pp_link}
 
         @classmethod
         def from_dict(cls, dct):
-            return cls(*tuple(dct.values()))
+            return cls(dct['pp_name'], dct.get('pp_link'))
 
         def __lt__(self, other):
             return self.pp_name < other.pp_name
@@ -868,6 +914,9 @@ class CommonCriteriaCert(Certificate, ComplexSerializableType):
         def from_dict(cls, dct: Dict[str, bool]):
             return cls(*tuple(dct.values()))
 
+    # TODO Fix me: For maintainance_updates this is a simplification. At the moment html contains more reliable info
+    html_preferred_attributes: ClassVar[FrozenSet[str]] = frozenset({'protection_profiles', 'maintainance_updates'})
+
     pandas_serialization_vars = ['dgst', 'name', 'manufacturer', 'scheme', 'security_level', 'not_valid_before',
                                  'not_valid_after', 'report_link', 'st_link', 'src', 'manufacturer_web']
 
@@ -882,12 +931,13 @@ class CommonCriteriaCert(Certificate, ComplexSerializableType):
                  cpe_matching: Optional[List[Tuple[str]]]):
         super().__init__()
 
-        self.status = status
-        self.category = category
+        # Status, category, scheme and security levels take only a handful of distinct values across all certs, intern them
+        self.status = sys.intern(status) if status is not None else None
+        self.category = sys.intern(category) if category is not None else None
         self.name = helpers.sanitize_string(name)
         self.manufacturer = helpers.sanitize_string(manufacturer)
-        self.scheme = scheme
-        self.security_level = helpers.sanitize_security_levels(security_level)
+        self.scheme = sys.intern(scheme) if scheme is not None else None
+        self.security_level = {sys.intern(x) for x in helpers.sanitize_security_levels(security_level)}
         self.not_valid_before = helpers.sanitize_date(not_valid_before)
         self.not_valid_after = helpers.sanitize_date(not_valid_after)
         self.report_link = helpers.sanitize_link(report_link)
@@ -930,22 +980,21 @@ class CommonCriteriaCert(Certificate, ComplexSerializableType):
             logger.warning(
                 f'Attempting to merge divergent certificates: self[dgst]={self.dgst}, other[dgst]={other.dgst}')
 
-        for att, val in vars(self).items():
+        self_attrs, other_attrs = self.__dict__, other.__dict__
+        html_over_csv = self.src == 'csv' and other.src == 'html'
+        for att, val in self_attrs.items():
             if not val:
-                setattr(self, att, getattr(other, att))
-            elif self.src == 'csv' and other.src == 'html' and att == 'protection_profiles':
-                setattr(self, att, getattr(other, att))
-            elif self.src == 'csv' and other.src == 'html' and att == 'maintainance_updates':
-                # TODO Fix me: This is a simplification. At the moment html contains more reliable info
-                setattr(self, att, getattr(other, att))
+                self_attrs[att] = other_attrs[att]
+            elif html_over_csv and att in self.html_preferred_attributes:
+                self_attrs[att] = other_attrs[att]
             elif att == 'src':
                 pass  # This is expected
             elif att == 'state':
-                setattr(self, att, getattr(other, att))
+                self_attrs[att] = other_attrs[att]
             else:
-                if getattr(self, att) != getattr(other, att):
+                if val != other_attrs[att]:
                     logger.warning(
-                        f'When merging certificates with dgst {self.dgst}, the following mismatch occured: Attribute={att}, self[{att}]={getattr(self, att)}, other[{att}]={getattr(other, att)}')
+                        f'When merging certificates with dgst {self.dgst}, the following mismatch occured: Attribute={att}, self[{att}]={val}, other[{att}]={other_attrs[att]}')
         if self.src != other.src:
             self.src = self.src + ' + ' + other.src
 
@@ -983,9 +1032,9 @@ class CommonCriteriaCert(Certificate, ComplexSerializableType):
                     return link.get('href')
             return None
 
-        def _get_protection_profiles(cell: Tag) -> set:
+        def _get_protection_profiles(links: List[Tag]) -> set:
             protection_profiles = set()
-            for link in list(cell.find_all('a')):
+            for link in links:
                 if link.get('href') is not None and '/ppfiles/' in link.get('href'):
                     protection_profiles.add(CommonCriteriaCert.ProtectionProfile(str(link.contents[0]),
                                                                                  CommonCriteriaCert.cc_url + link.get(
@@ -994,12 +1043,9 @@ class CommonCriteriaCert(Certificate, ComplexSerializableType):
 
         def _get_date(cell: Tag) -> date:
             text = cell.get_text()
-            extracted_date = datetime.strptime(
-                text, '%Y-%m-%d').date() if text else None
-            return extracted_date
+            return date.fromisoformat(text) if text else None
 
-        def _get_report_st_links(cell: Tag) -> (str, str):
-            links = cell.find_all('a')
+        def _get_report_st_links(links: List[Tag]) -> (str, str):
             # TODO: Exception checks
             assert links[1].get('title').startswith('Certification Report')
             assert links[2].get('title').startswith('Security Target')
@@ -1025,20 +1071,21 @@ class CommonCriteriaCert(Certificate, ComplexSerializableType):
             possible_updates = list(main_div.find_all('li'))
             maintainance_updates = set()
             for u in possible_updates:
-                text = list(u.stripped_strings)[0]
-                main_date = datetime.strptime(text.split(
-                    ' ')[0], '%Y-%m-%d').date() if text else None
-                main_title = text.split('– ')[1]
+                text = next(u.stripped_strings, '')
+                if not (match := CommonCriteriaCert.maintainance_entry_pattern.match(text)):
+                    logger.error(f'Unexpected format of maintainance entry: {text}')
+                    continue
+                main_date = date.fromisoformat(match.group(1))
+                main_title = match.group(2)
                 main_report_link = None
                 main_st_link = None
                 links = u.find_all('a')
                 for l in links:
-                    if l.get('title').startswith('Maintenance Report:'):
-                        main_report_link = CommonCriteriaCert.cc_url + \
-                                           l.get('href')
-                    elif l.get('title').startswith('Maintenance ST'):
-                        main_st_link = CommonCriteriaCert.cc_url + \
-                                       l.get('href')
+                    title = l.get('title')
+                    if title.startswith('Maintenance Report:'):
+                        main_report_link = CommonCriteriaCert.cc_url + l.get('href')
+                    elif title.startswith('Maintenance ST'):
+                        main_st_link = CommonCriteriaCert.cc_url + l.get('href')
                     else:
                         logger.error('Unknown link in Maintenance part!')
                 maintainance_updates.add(
@@ -1055,10 +1102,12 @@ class CommonCriteriaCert(Certificate, ComplexSerializableType):
         manufacturer_web = _get_manufacturer_web(cells[1])
         scheme = _get_scheme(cells[6])
         security_level = _get_security_level(cells[5])
-        protection_profiles = _get_protection_profiles(cells[0])
+        # The first cell holds most of the links, walk it only once
+        name_cell_links = cells[0].find_all('a')
+        protection_profiles = _get_protection_profiles(name_cell_links)
         not_valid_before = _get_date(cells[3])
         not_valid_after = _get_date(cells[4])
-        report_link, st_link = _get_report_st_links(cells[0])
+        report_link, st_link = _get_report_st_links(name_cell_links)
         cert_link = _get_cert_link(cells[2])
 
         maintainance_div = _get_maintainance_div(cells[0])
@@ -1074,14 +1123,15 @@ class CommonCriteriaCert(Certificate, ComplexSerializableType):
                         st_pdf_dir: Optional[Union[str, Path]],
                         report_txt_dir: Optional[Union[str, Path]],
                         st_txt_dir: Optional[Union[str, Path]]):
+        dgst = self.dgst
         if report_pdf_dir is not None:
-            self.state.report_pdf_path = Path(report_pdf_dir) / (self.dgst + '.pdf')
+            self.state.report_pdf_path = Path(report_pdf_dir) / (dgst + '.pdf')
         if st_pdf_dir is not None:
-            self.state.st_pdf_path = Path(st_pdf_dir) / (self.dgst + '.pdf')
+            self.state.st_pdf_path = Path(st_pdf_dir) / (dgst + '.pdf')
         if report_txt_dir is not None:
-            self.state.report_txt_path = Path(report_txt_dir) / (self.dgst + '.txt')
+            self.state.report_txt_path = Path(report_txt_dir) / (dgst + '.txt')
         if st_txt_dir is not None:
-            self.state.st_txt_path = Path(st_txt_dir) / (self.dgst + '.txt')
+            self.state.st_txt_path = Path(st_txt_dir) / (dgst + '.txt')
 
     @staticmethod
     def download_pdf_report(cert: 'CommonCriteriaCert') -> 'CommonCriteriaCert':
@@ -15,7 +15,7 @@ import shutil
 from graphviz import Digraph
 import requests
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer
 from rapidfuzz import process, fuzz
 import xml.etree.ElementTree as ET
 
@@ -151,6 +151,9 @@ class CCDataset(Dataset, ComplexSerializableType):
             state = self.DatasetInternalState()
         self.state = state
 
+    def __contains__(self, item: 'CommonCriteriaCert') -> bool:
+        return item.dgst in self.certs
+
     def to_dict(self):
         return {**{'state': self.state}, **super().to_dict()}
 
@@ -242,10 +245,10 @@ class CCDataset(Dataset, ComplexSerializableType):
         will_be_added = {}
         n_merged = 0
         for crt in certs.values():
-            if crt not in self:
-                will_be_added[crt.dgst] = crt
+            if (dgst := crt.dgst) not in self.certs:
+                will_be_added[dgst] = crt
             else:
-                self[crt.dgst].merge(crt)
+                self[dgst].merge(crt)
                 n_merged += 1
 
         self.certs.update(will_be_added)
@@ -322,10 +325,6 @@ class CCDataset(Dataset, ComplexSerializableType):
         Using pandas, this parses a single CSV file.
         """
 
-        def _get_primary_key_str(row: Tag):
-            prim_key = row['category'] + row['cert_name'] + row['report_link']
-            return prim_key
-
         if 'active' in str(file):
             cert_status = 'active'
         else:
@@ -345,8 +344,8 @@ class CCDataset(Dataset, ComplexSerializableType):
         df[['not_valid_before', 'not_valid_after', 'maintainance_date']] = df[
             ['not_valid_before', 'not_valid_after', 'maintainance_date']].apply(pd.to_datetime)
 
-        df['dgst'] = df.apply(lambda row: helpers.get_first_16_bytes_sha256(
-            _get_primary_key_str(row)), axis=1)
+        # Primary key is assembled column-wise, row-wise apply() would construct a Series for each row
+        df['dgst'] = (df.category + df.cert_name + df.report_link).map(helpers.get_first_16_bytes_sha256)
         df_base = df.loc[df.is_maintainance == False].copy()
         df_main = df.loc[df.is_maintainance == True].copy()
 
@@ -458,8 +457,10 @@ class CCDataset(Dataset, ComplexSerializableType):
                          ]
         cat_dict = {x: y for (x, y) in zip(cc_table_ids, cc_categories)}
 
+        # Only the product tables are of interest, the rest of the page need not be turned into a tree at all
+        only_tables = SoupStrainer('table', id=lambda x: x in cat_dict)
         with file.open('r') as handle:
-            soup = BeautifulSoup(handle, 'html.parser')
+            soup = BeautifulSoup(handle, 'lxml', parse_only=only_tables)
 
         certs = {}
         for key, val in cat_dict.items():
@@ -1,12 +1,25 @@
 import json
 from datetime import date
 from pathlib import Path
-from typing import Dict
+from typing import Dict, ClassVar, Type
 
 from abc import ABC, abstractmethod
 
 
 class ComplexSerializableType(ABC):
+    __slots__ = ()
+
+    # Registry of de-serializable types, keyed by the class name stored in the '_type' field
+    serializable_complex_types: ClassVar[Dict[str, Type['ComplexSerializableType']]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        registry = ComplexSerializableType.serializable_complex_types
+        if (registered := registry.get(cls.__name__)) is not None and registered is not cls:
+            raise TypeError(f'Cannot register {cls.__qualname__} for de-serialization, '
+                            f'name {cls.__name__} is already taken by {registered.__qualname__}.')
+        registry[cls.__name__] = cls
+
     @classmethod
     @abstractmethod
     def to_dict(cls):
@@ -33,17 +46,17 @@ class CustomJSONEncoder(json.JSONEncoder):
 
 class CustomJSONDecoder(json.JSONDecoder):
     """
-    Custom JSONDecoder. Any complex object that should be de-serializable must inherit directly from class
-    ComplexSerializableType (nested inheritance does not currently work (because x.__subclassess__() prints only direct
-    subclasses. Any such class must implement methods to_dict() and from_dict(). These are used to drive serialization.
+    Custom JSONDecoder. Any complex object that should be de-serializable must inherit from class
+    ComplexSerializableType, which registers it under its class name when the class is created. Any such class must
+    implement methods to_dict() and from_dict(). These are used to drive serialization.
     """
     def __init__(self, *args, **kwargs):
         json.JSONDecoder.__init__(self, object_hook=self.object_hook, *args, **kwargs)
-        self.serializable_complex_types = {x.__name__: x for x in ComplexSerializableType.__subclasses__()}
+        self.serializable_complex_types = ComplexSerializableType.serializable_complex_types
 
     def object_hook(self, obj):
-        if '_type' in obj and obj['_type'] in self.serializable_complex_types.keys():
-            complex_type = obj.pop('_type')
-            return self.serializable_complex_types[complex_type].from_dict(obj)
+        if (complex_type := self.serializable_complex_types.get(obj.get('_type'))) is not None:
+            del obj['_type']
+            return complex_type.from_dict(obj)
 
         return obj
@@ -6,8 +6,12 @@ import json
 import filecmp
 import shutil
 import os
+from bs4 import BeautifulSoup
+import copy
+import pickle
 
 from sec_certs.dataset import CCDataset
+from sec_certs.serialization import ComplexSerializableType, CustomJSONDecoder, CustomJSONEncoder
 from sec_certs.certificate import CommonCriteriaCert
 import sec_certs.helpers as helpers
 
@@ -132,14 +136,20 @@ class TestCommonCriteriaOOP(TestCase):
                             'The dataset serialized to json differs from a template.')
 
     def test_cert_from_json(self):
-        self.assertEqual(self.fictional_cert,
-                         CommonCriteriaCert.from_json(self.test_data_dir / 'fictional_cert.json'),
-                         'The certificate serialized from json differs from a template.')
+        crt = CommonCriteriaCert.from_json(self.test_data_dir / 'fictional_cert.json')
+        self.assertEqual(self.fictional_cert, crt, 'The certificate serialized from json differs from a template.')
+        self.assertIsInstance(crt.security_level, set, 'Security level should be loaded as a set.')
+
+    def test_cert_from_dict_null_scheme(self):
+        dct = self.fictional_cert.to_dict()
+        dct['scheme'] = None
+        self.assertIsNone(CommonCriteriaCert.from_dict(dct).scheme, 'Null scheme should be loaded as None.')
 
     def test_dataset_from_json(self):
-        self.assertEqual(self.template_dataset,
-                         CCDataset.from_json(self.test_data_dir / 'toy_dataset.json'),
-                         'The dataset serialized from json differs from a template.')
+        dset = CCDataset.from_json(self.test_data_dir / 'toy_dataset.json')
+        self.assertEqual(self.template_dataset, dset, 'The dataset serialized from json differs from a template.')
+        for crt in dset:
+            self.assertIsInstance(crt.security_level, set, 'Security level should be loaded as a set.')
 
     def test_build_empty_dataset(self):
         with TemporaryDirectory() as tmp_dir:
@@ -164,3 +174,90 @@ class TestCommonCriteriaOOP(TestCase):
 
         self.assertTrue(self.crt_one in dset, 'The dataset does not contain the template certificate.')
         self.assertEqual(dset, self.template_dataset, 'The loaded dataset does not match the template dataset.')
+
+    def test_copy_does_not_resanitize(self):
+        update = CommonCriteriaCert.MaintainanceReport(date(1900, 1, 1), 'A &amp;amp;lt; B', 'https://maintainance.up', None)
+        pp = CommonCriteriaCert.ProtectionProfile('A &amp;amp;lt; B', 'http://sample.pp')
+        for obj in (update, pp):
+            for duplicate in (copy.deepcopy(obj), pickle.loads(pickle.dumps(obj))):
+                self.assertEqual(obj, duplicate, 'Copied object differs from the original.')
+                self.assertEqual(hash(obj), hash(duplicate), 'Copied object hashes differently.')
+
+    def test_html_row_maintainance_updates(self):
+        row_html = """
+        <table><tr>
+        <td>Sample certificate name
+            <a name="sample"></a>
+            <div>
+                <a href="/files/epfiles/report.pdf" title="Certification Report: report.pdf">Certification Report</a>
+                <a href="/files/epfiles/st.pdf" title="Security Target: st.pdf">Security Target</a>
+                <div>
+                    <div>Maintenance Report(s)</div>
+                    <ul>
+                        <li>2021-01-12 – First update
+                            <a href="/files/epfiles/main_report.pdf" title="Maintenance Report: main_report.pdf">Report</a>
+                            <a href="/files/epfiles/main_st.pdf" title="Maintenance ST: main_st.pdf">ST</a>
+                        </li>
+                        <li>2021-02-03 – Second update – Maintenance</li>
+                        <li>Malformed update</li>
+                        <li></li>
+                    </ul>
+                </div>
+            </div>
+        </td>
+        <td><a href="http://manufacturer.web" title="Vendor's web site">Sample manufacturer</a></td>
+        <td><a href="/files/epfiles/cert.pdf">Certificate</a></td>
+        <td>2020-06-15</td>
+        <td>2025-06-15</td>
+        <td>EAL2</td>
+        <td>SE</td>
+        </tr></table>
+        """
+        row = BeautifulSoup(row_html, 'lxml').find('tr')
+
+        with self.assertLogs('sec_certs.certificate', level='ERROR') as logs:
+            cert = CommonCriteriaCert.from_html_row(row, 'active', 'Sample category')
+        self.assertEqual(len(logs.output), 2, 'Both malformed maintainance entries should be logged.')
+
+        expected_updates = {
+            CommonCriteriaCert.MaintainanceReport(date(2021, 1, 12), 'First update',
+                                                  'http://commoncriteriaportal.org/files/epfiles/main_report.pdf',
+                                                  'http://commoncriteriaportal.org/files/epfiles/main_st.pdf'),
+            CommonCriteriaCert.MaintainanceReport(date(2021, 2, 3), 'Second update', None, None)}
+        self.assertEqual(cert.maintainance_updates, expected_updates,
+                         'Maintainance updates parsed from html row do not match the template.')
+
+    def test_decoder_resolves_registered_types(self):
+        registry = ComplexSerializableType.serializable_complex_types
+        self.addCleanup(registry.pop, 'DerivedProtectionProfile', None)
+
+        class DerivedProtectionProfile(CommonCriteriaCert.ProtectionProfile):
+            __slots__ = ()
+
+        with self.assertRaises(TypeError, msg='Name clash in the de-serialization registry was not detected.'):
+            class DerivedProtectionProfile(CommonCriteriaCert.MaintainanceReport):
+                __slots__ = ()
+        for cls in (CommonCriteriaCert, CommonCriteriaCert.ProtectionProfile, CommonCriteriaCert.MaintainanceReport,
+                    CommonCriteriaCert.InternalState, CommonCriteriaCert.PdfData, CCDataset,
+                    CCDataset.DatasetInternalState, DerivedProtectionProfile):
+            self.assertIs(registry[cls.__name__], cls, f'{cls.__name__} is not registered for de-serialization.')
+
+        derived = DerivedProtectionProfile('Derived pp', 'http://derived.pp')
+        decoded = json.loads(json.dumps([derived, self.fictional_cert, self.template_dataset], cls=CustomJSONEncoder),
+                             cls=CustomJSONDecoder)
+        self.assertIs(type(decoded[0]), DerivedProtectionProfile, 'Indirect subclass was not de-serialized.')
+        self.assertEqual(decoded[0], derived, 'Indirect subclass does not survive the json round trip.')
+
+        cert = decoded[1]
+        self.assertEqual(cert, self.fictional_cert, 'Certificate does not survive the json round trip.')
+        self.assertEqual(cert.protection_profiles, self.fictional_cert.protection_profiles)
+        self.assertTrue(all(isinstance(x, CommonCriteriaCert.MaintainanceReport) for x in cert.maintainance_updates))
+        self.assertEqual({x.maintainance_title for x in cert.maintainance_updates},
+                         {x.maintainance_title for x in self.fictional_cert.maintainance_updates})
+        self.assertIsInstance(cert.state, CommonCriteriaCert.InternalState)
+        self.assertIsInstance(cert.pdf_data, CommonCriteriaCert.PdfData)
+
+        dset = decoded[2]
+        self.assertEqual(dset, self.template_dataset, 'Dataset does not survive the json round trip.')
+        self.assertIsInstance(dset.state, CCDataset.DatasetInternalState)
+        self.assertTrue(dset.state.meta_sources_parsed)